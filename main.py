@@ -13,48 +13,95 @@ Endpoints
   ``budget`` (float), ``ambiance`` (str), ``platform_pref`` (str),
   ``interactivity`` (int), ``style`` (str) and ``timeline`` (str).  Returns
   the created campaign record with an auto‑generated ID and timestamp.
+* ``POST /campaigns/bulk`` – Submit a list of campaigns in one transaction.
 * ``GET /campaigns`` – List all campaigns.
 * ``POST /designers`` – Register a new designer.  Accepts JSON fields
   ``name`` (str), ``rate_tier`` (float), ``scene_tags`` (list of str),
   ``export_formats`` (list of str), ``game_logic_experience`` (int),
   ``visual_metadata`` (list of str), ``availability`` (str) and
   ``performance_score`` (float).  Returns the created designer record.
+* ``POST /designers/bulk`` – Register a list of designers in one
+  transaction.
 * ``GET /designers`` – List all designers.
 * ``POST /match`` – Match designers to a campaign.  Accepts JSON with
-  ``campaign_id`` and optional ``threshold`` (defaults to 60).  Returns a
-  sorted list of designers that meet or exceed the match threshold along
-  with their scores.
+  ``campaign_id``, optional ``threshold`` (defaults to 60) and optional
+  ``limit``.  Returns a sorted list of designers that meet or exceed the
+  match threshold along with their scores, truncated to the ``limit`` best
+  matches when one is given.
 
 To run the API locally:
 
 ```
-uvicorn backend.main:app --reload --host 0.0.0.0 --port 8000
+python prestart.py
+uvicorn main:app --reload --host 0.0.0.0 --port 8000
 ```
 
-This will serve the API on ``http://localhost:8000``.
+This will serve the API on ``http://localhost:8000``.  ``prestart.py``
+creates or migrates the database schema; the API workers only open
+connections to it.
 """
 
 from __future__ import annotations
 
-import datetime
-import json
+import asyncio
+import queue
+import random
+import secrets
 import sqlite3
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import AsyncIterator, Callable, Iterator, List, Dict, Any, Mapping, Optional, Tuple, TypeVar
 
-from fastapi import FastAPI, HTTPException
+import numpy as np
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; scoring falls back to plain NumPy
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 # -----------------------------------------------------------------------------
 # Database utilities
 # -----------------------------------------------------------------------------
 
 DATABASE_NAME = "orbitivexr.db"
+POOL_SIZE = 8
+
+# Applied to every pooled connection.  The database is in WAL mode (set once
+# by ``bootstrap_schema``), so with synchronous=NORMAL a commit no longer
+# fsyncs.  mmap_size maps up to 256 MiB of the file so hot pages are read
+# without a read() call.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+T = TypeVar("T")
+
+# Campaign fields matched against a designer list column, and the junction
+# table linking designers to the tags in that column.
+TAG_CRITERIA = (
+    ("ambiance", "scene_tags", "designer_scene_tags"),
+    ("platform_pref", "export_formats", "designer_export_formats"),
+    ("style", "visual_metadata", "designer_visual_metadata"),
+)
 
 
-def init_db() -> None:
-    """Initialise the SQLite database if tables do not exist."""
-    conn = sqlite3.connect(DATABASE_NAME)
-    c = conn.cursor()
+def create_base_tables(c: sqlite3.Cursor) -> None:
+    """Schema v1: campaigns, designers and their generation counters."""
     c.execute(
         """
         CREATE TABLE IF NOT EXISTS campaigns (
@@ -84,49 +131,238 @@ def init_db() -> None:
         )
         """
     )
-    conn.commit()
-    conn.close()
+    # Generation counters bumped on every write so each worker process can
+    # tell when its in‑memory caches are stale.
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS table_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    c.execute("INSERT OR IGNORE INTO table_versions (name) VALUES ('campaigns'), ('designers')")
+
+
+def create_tag_links(c: sqlite3.Cursor) -> None:
+    """Schema v2: tag dictionary and designer/tag junction tables.
+
+    The JSON list columns stay as the ordered copy returned to clients;
+    membership is answered from these indexed tables.
+    """
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tags (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        )
+        """
+    )
+    for _, column, table in TAG_CRITERIA:
+        c.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                designer_id INTEGER NOT NULL REFERENCES designers(id),
+                tag_id INTEGER NOT NULL REFERENCES tags(id),
+                PRIMARY KEY (designer_id, tag_id)
+            ) WITHOUT ROWID
+            """
+        )
+        c.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_tag ON {table}(tag_id, designer_id)")
+        # Link designers stored before the junction tables existed
+        c.execute(
+            f"""
+            INSERT OR IGNORE INTO tags (name)
+            SELECT j.value FROM designers AS d, json_each(d.{column}) AS j
+            WHERE json_valid(d.{column}) AND j.type = 'text'
+            """
+        )
+        c.execute(
+            f"""
+            INSERT OR IGNORE INTO {table} (designer_id, tag_id)
+            SELECT d.id, t.id FROM designers AS d, json_each(d.{column}) AS j
+            JOIN tags AS t ON t.name = j.value
+            WHERE json_valid(d.{column}) AND j.type = 'text'
+            """
+        )
 
 
-def dict_factory(cursor, row) -> Dict[str, Any]:
-    """Convert SQLite rows to dictionaries for JSON serialization."""
-    d: Dict[str, Any] = {}
-    for idx, col in enumerate(cursor.description):
-        d[col[0]] = row[idx]
-    return d
+# Migration ``i`` brings the schema from version ``i`` to ``i + 1``.  Each is
+# written to also apply cleanly to databases created before schema_version
+# was tracked.
+MIGRATIONS: Tuple[Callable[[sqlite3.Cursor], None], ...] = (create_base_tables, create_tag_links)
+SCHEMA_VERSION = len(MIGRATIONS)
 
 
-def get_db_connection() -> sqlite3.Connection:
-    """Open a connection to the SQLite database with row factory."""
-    conn = sqlite3.connect(DATABASE_NAME)
-    conn.row_factory = dict_factory
-    return conn
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version recorded in ``conn``, 0 if none is."""
+    try:
+        row = conn.execute("SELECT v FROM schema_version").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+
+def bootstrap_schema(path: str = DATABASE_NAME) -> None:
+    """Create or migrate the database at ``path`` to ``SCHEMA_VERSION``.
+
+    Run once by ``prestart.py`` before any worker starts, so workers only
+    ever open connections.  The migrations run in one ``BEGIN IMMEDIATE``
+    transaction, so a concurrent bootstrap waits and then finds nothing to do.
+
+    Every run also writes a fresh random ``deployment`` token.  It is part
+    of the list ETags, so tags issued against a re-created or restored
+    database, or by a previous deploy, never match.
+    """
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        # Persistent: recorded in the database file, not per connection
+        conn.execute("PRAGMA journal_mode=WAL")
+        with transaction(conn):
+            conn.execute("CREATE TABLE IF NOT EXISTS schema_version (v INTEGER NOT NULL)")
+            version = get_schema_version(conn)
+            if version > SCHEMA_VERSION:
+                raise RuntimeError(
+                    f"{path} is at schema version {version}, newer than this code ({SCHEMA_VERSION})"
+                )
+            c = conn.cursor()
+            for migrate in MIGRATIONS[version:]:
+                migrate(c)
+            conn.execute("DELETE FROM schema_version")
+            conn.execute("INSERT INTO schema_version (v) VALUES (?)", (SCHEMA_VERSION,))
+            conn.execute("CREATE TABLE IF NOT EXISTS deployment (token TEXT NOT NULL)")
+            conn.execute("DELETE FROM deployment")
+            conn.execute("INSERT INTO deployment (token) VALUES (?)", (secrets.token_hex(8),))
+    finally:
+        conn.close()
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run a block of statements on an autocommit connection atomically."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        # Also reached when COMMIT itself fails (disk full, I/O error, busy);
+        # the connection must not go back to the pool holding the write lock.
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+def get_table_version(conn: sqlite3.Connection, table: str) -> int:
+    row = conn.execute("SELECT version FROM table_versions WHERE name = ?", (table,)).fetchone()
+    return row["version"] if row else 0
+
+
+def bump_table_version(conn: sqlite3.Connection, table: str) -> None:
+    conn.execute("UPDATE table_versions SET version = version + 1 WHERE name = ?", (table,))
+
+
+class ConnectionPool:
+    """A bounded pool of long‑lived SQLite connections.
+
+    Connections are opened once and handed out LIFO so the most recently used
+    connection (and its warm page cache) is reused first.  They run in
+    autocommit mode (``isolation_level=None``); each statement commits on its
+    own unless an explicit ``BEGIN`` is issued.
+
+    Async endpoints use ``run``, which waits for a free connection on an
+    asyncio semaphore and then does the blocking SQLite work in a worker
+    thread, so a slow query never stalls the event loop.
+    """
+
+    def __init__(self, database: str, size: int = POOL_SIZE) -> None:
+        self._queue: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=size)
+        self._slots = asyncio.Semaphore(size)
+        for _ in range(size):
+            self._queue.put(self._connect(database))
+
+    @staticmethod
+    def _connect(database: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(database, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection, returning it to the pool when done."""
+        conn = self._queue.get()
+        try:
+            yield conn
+        finally:
+            self._queue.put(conn)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Call ``func(conn, *args)`` on a pooled connection in a worker thread."""
+        async with self._slots:
+            return await asyncio.to_thread(self._call, func, *args)
+
+    def _call(self, func: Callable[..., T], *args: Any) -> T:
+        # The connection is borrowed and returned inside the worker thread, so
+        # it is never handed out again while a cancelled caller's query is
+        # still running on it.
+        with self.acquire() as conn:
+            return func(conn, *args)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# Created by ``startup_event``; endpoints borrow connections from it.
+pool: Optional[ConnectionPool] = None
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp.
+_timestamp_prefix = (-1, "")
+_timestamp_lock = threading.Lock()
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as ``YYYY-MM-DDTHH:MM:SS.ffffff``.
+
+    The date and time are formatted once per wall‑clock second; within that
+    second only the microseconds are appended to the cached prefix.
+    """
+    global _timestamp_prefix
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _timestamp_prefix
+    if second != cached_second:
+        with _timestamp_lock:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            _timestamp_prefix = (second, prefix)
+    return "%s.%06d" % (prefix, nanos // 1000)
 
 
 def serialize_list(items: List[str]) -> str:
-    return json.dumps(items) if items is not None else json.dumps([])
+    return orjson.dumps(items if items is not None else []).decode()
 
 
 def deserialize_list(data: Optional[Any]) -> List[str]:
-    """Deserialize a list stored as JSON or return the list if already a list.
+    """Decode a list column stored as JSON.
 
-    The database stores lists as JSON strings.  However, when using the
-    in‑memory objects during matching (e.g. in tests), these values may
-    already be Python lists.  This helper normalizes both cases.
+    Returns ``[]`` for ``NULL`` or malformed values; a value that is already
+    a list is returned as is.
     """
     if data is None:
         return []
     # If data is already a list, return it directly
     if isinstance(data, list):
         return data
-    # If data is a JSON string, attempt to decode
+    # If data is a JSON string, attempt to decode (orjson skips surrounding
+    # whitespace and rejects empty input)
     if isinstance(data, str):
-        data = data.strip()
-        if not data:
-            return []
         try:
-            return json.loads(data)
-        except Exception:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
             # Return empty list on failure
             return []
     # Fallback: return an empty list
@@ -169,6 +405,7 @@ class DesignerOut(DesignerCreate):
 class MatchRequest(BaseModel):
     campaign_id: int
     threshold: float = 60.0
+    limit: Optional[int] = Field(default=None, ge=1)
 
 
 class ScoredDesigner(BaseModel):
@@ -176,193 +413,660 @@ class ScoredDesigner(BaseModel):
     score: float
 
 
+# Read endpoints serialize trusted database rows straight to JSON.  These
+# build the same shapes as ``CampaignOut``/``DesignerOut`` without a
+# validation pass per row.
+
+def campaign_out(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "budget": row["budget"],
+        "ambiance": row["ambiance"],
+        "platform_pref": row["platform_pref"],
+        "interactivity": row["interactivity"],
+        "style": row["style"],
+        "timeline": row["timeline"],
+        "id": row["id"],
+        "submitted_at": row["submitted_at"],
+    }
+
+
+def designer_out(d: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a designer whose list columns are already decoded."""
+    return {
+        "name": d["name"],
+        "rate_tier": d["rate_tier"],
+        "scene_tags": d["scene_tags"],
+        "export_formats": d["export_formats"],
+        "game_logic_experience": d["game_logic_experience"],
+        "visual_metadata": d["visual_metadata"],
+        "availability": d["availability"],
+        "performance_score": d["performance_score"] or 0.0,
+        "id": d["id"],
+    }
+
+
 # -----------------------------------------------------------------------------
 # Matching logic
 # -----------------------------------------------------------------------------
 
-def calculate_match_score(campaign: Dict[str, Any], designer: Dict[str, Any]) -> float:
+def calculate_match_score(campaign: Mapping[str, Any], designer: Mapping[str, Any]) -> float:
+    """Score one parsed designer against ``campaign`` the straightforward way.
+
+    This is the reference ``warm_up_scoring`` checks every fast path against.
+    """
     score = 0.0
-    # Budget compatibility (20 %)
+    # Budget compatibility (20 %)
     if designer["rate_tier"] is not None and campaign["budget"] >= designer["rate_tier"]:
         score += 20.0
-    # Ambiance match (20 %)
-    scene_tags = deserialize_list(designer.get("scene_tags"))
-    if campaign.get("ambiance") and campaign["ambiance"] in scene_tags:
+    # Ambiance match (20 %)
+    if campaign["ambiance"] and campaign["ambiance"] in designer["scene_tags"]:
         score += 20.0
-    # Platform preference (15 %)
-    export_formats = deserialize_list(designer.get("export_formats"))
-    if campaign.get("platform_pref") and campaign["platform_pref"] in export_formats:
+    # Platform preference (15 %)
+    if campaign["platform_pref"] and campaign["platform_pref"] in designer["export_formats"]:
         score += 15.0
-    # Interactivity level (15 %)
-    if designer.get("game_logic_experience") is not None and campaign.get("interactivity") is not None:
+    # Interactivity level (15 %)
+    if designer["game_logic_experience"] is not None and campaign["interactivity"] is not None:
         if designer["game_logic_experience"] >= campaign["interactivity"]:
             score += 15.0
-    # Style aesthetic (15 %)
-    visual_metadata = deserialize_list(designer.get("visual_metadata"))
-    if campaign.get("style") and campaign["style"] in visual_metadata:
+    # Style aesthetic (15 %)
+    if campaign["style"] and campaign["style"] in designer["visual_metadata"]:
         score += 15.0
-    # Timeline alignment (10 %) – simple lexicographic comparison as placeholder
-    if designer.get("availability") and campaign.get("timeline"):
+    # Timeline alignment (10 %) – simple lexicographic comparison as placeholder
+    if designer["availability"] and campaign["timeline"]:
         if designer["availability"] <= campaign["timeline"]:
             score += 10.0
-    # Past performance (5 %)
-    if designer.get("performance_score"):
-        score += float(designer["performance_score"]) * 5.0
+    # Past performance (5 %)
+    if designer["performance_score"]:
+        score += designer["performance_score"] * 5.0
     return score
 
 
+# Tag columns with at most this many 64-tag words of distinct tags are held as
+# bitmaps; wider vocabularies use per-tag designer indices (see DesignerArrays).
+MAX_BITMAP_WORDS = 4
+
+
+class DesignerArrays:
+    """Column‑oriented snapshot of the designers table used for matching.
+
+    Numeric criteria are held in parallel NumPy arrays so a campaign can be
+    scored against every designer in a handful of vector operations.  ``rows``
+    are designer dicts as produced by ``parse_designer``.  Missing
+    ``rate_tier``/``game_logic_experience`` values are stored as NaN, so the
+    criteria comparing them are never met.
+
+    Each tag column is indexed over only the tags that occur in it, each
+    given a slot.  Up to ``MAX_BITMAP_WORDS * 64`` slots, the column is a
+    bitmap of ``uint64`` words shaped ``(words, designers)`` so testing a
+    tag reads one contiguous row.  Tags are free-form, so a column with more
+    distinct tags instead keeps the sorted designer indices of each slot,
+    which costs memory in proportion to the links rather than to
+    tags × designers.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], version: int, tag_ids: Mapping[str, int]) -> None:
+        n = len(rows)
+        self.version = version
+        self.rows = rows
+        self.tag_ids = tag_ids
+        self.rate_tier = np.fromiter(
+            (np.nan if r["rate_tier"] is None else r["rate_tier"] for r in rows), np.float64, n
+        )
+        self.game_logic_experience = np.fromiter(
+            (np.nan if r["game_logic_experience"] is None else r["game_logic_experience"] for r in rows),
+            np.float64,
+            n,
+        )
+        self.availability = np.array([r["availability"] or "" for r in rows], dtype=str)
+        # The performance term is fixed per designer, so it is weighted once here
+        self.performance_points = (
+            np.fromiter((r["performance_score"] or 0.0 for r in rows), np.float64, n) * 5.0
+        )
+        self.tag_index = {column: self._index_tags(column + "_ids") for _, column, _ in TAG_CRITERIA}
+        # Serialized /match responses against this snapshot, keyed by
+        # (campaign id, threshold, limit) and filled by ``ranked_response``.
+        # The dict holds no reference back to the snapshot, so it is freed
+        # with it as soon as a designers write replaces the snapshot.
+        self.responses: OrderedDict[Tuple[int, float, Optional[int]], bytes] = OrderedDict()
+        self.responses_lock = threading.Lock()
+
+    def _index_tags(
+        self, key: str
+    ) -> Tuple[Dict[int, int], Optional[np.ndarray], Optional[List[np.ndarray]]]:
+        """Index one tag column as ``(tag id -> slot, bitmap, per-slot designers)``.
+
+        Exactly one of the bitmap and the per-slot designer indices is set.
+        """
+        designer = np.fromiter((i for i, r in enumerate(self.rows) for _ in r[key]), np.int64)
+        tag = np.fromiter((tag_id for r in self.rows for tag_id in r[key]), np.int64, len(designer))
+        tags, slot = np.unique(tag, return_inverse=True)
+        slots = dict(zip(tags.tolist(), range(len(tags))))
+        words = -(-len(tags) // 64)
+        if words <= MAX_BITMAP_WORDS:
+            bits = np.zeros((words, len(self.rows)), dtype=np.uint64)
+            masks = np.left_shift(np.uint64(1), (slot & 63).astype(np.uint64))
+            np.bitwise_or.at(bits, (slot >> 6, designer), masks)
+            return slots, bits, None
+        # ``designer`` is ascending, so a stable sort keeps each slot's indices sorted
+        order = np.argsort(slot, kind="stable")
+        members = np.split(designer[order], np.cumsum(np.bincount(slot, minlength=len(tags)))[:-1])
+        return slots, None, members
+
+    def tag_hits(self, column: str, tag: Optional[str]) -> np.ndarray:
+        """Boolean array marking designers whose ``column`` list contains ``tag``."""
+        slots, bits, members = self.tag_index[column]
+        slot = slots.get(self.tag_ids.get(tag)) if tag else None
+        if slot is None:
+            return np.zeros(len(self.rows), dtype=bool)
+        if bits is not None:
+            return (bits[slot >> 6] & np.uint64(1 << (slot & 63))) != 0
+        hits = np.zeros(len(self.rows), dtype=bool)
+        hits[members[slot]] = True
+        return hits
+
+
+@njit(cache=True, nogil=True)
+def _score_kernel(
+    rate, gle, points, avail_le, ambiance_hit, platform_hit, style_hit,
+    budget, interactivity, threshold, out_scores, out_mask,
+):  # pragma: no cover - compiled by Numba
+    """Fused scoring loop: one pass over the arrays, no temporaries.
+
+    NaN inputs must compare false, so ``fastmath`` is deliberately off; it
+    would also allow FMA contraction and break parity with the NumPy path.
+    The kernel only touches arrays and scalars, so it releases the GIL
+    (``nogil``): the event loop and other requests keep running while it
+    scores, and concurrent requests score in parallel on the server's worker
+    threads.  The loop itself runs serially, since Numba's parallel
+    threading layers are either not safe to call from several threads or
+    hang on shutdown.
+    """
+    for i in range(rate.shape[0]):
+        s = 0.0
+        if rate[i] <= budget:
+            s += 20.0
+        if ambiance_hit[i]:
+            s += 20.0
+        if platform_hit[i]:
+            s += 15.0
+        if gle[i] >= interactivity:
+            s += 15.0
+        if style_hit[i]:
+            s += 15.0
+        if avail_le[i]:
+            s += 10.0
+        s += points[i]
+        out_scores[i] = s
+        out_mask[i] = s >= threshold
+
+
+def score_designers(
+    campaign: Mapping[str, Any],
+    designers: DesignerArrays,
+    threshold: float,
+    use_kernel: bool = HAVE_NUMBA,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Score every designer against ``campaign`` at once.
+
+    Weights: budget 20, ambiance 20, platform 15, interactivity 15, style 15,
+    timeline 10, plus five times the performance score.  Returns the scores
+    and a mask of designers reaching ``threshold``.  The fused Numba kernel
+    is used when Numba is installed (``use_kernel``), NumPy array arithmetic
+    otherwise; both accumulate the terms in the same order, so they produce
+    identical floating point scores.
+    """
+    ambiance_hit = designers.tag_hits("scene_tags", campaign["ambiance"])
+    platform_hit = designers.tag_hits("export_formats", campaign["platform_pref"])
+    style_hit = designers.tag_hits("visual_metadata", campaign["style"])
+    if campaign["timeline"]:
+        avail_le = (designers.availability != "") & (designers.availability <= campaign["timeline"])
+    else:
+        avail_le = np.zeros(len(designers.rows), dtype=bool)
+    interactivity = campaign["interactivity"]
+    interactivity = np.nan if interactivity is None else float(interactivity)
+
+    if use_kernel:
+        n = len(designers.rows)
+        scores = np.empty(n, dtype=np.float64)
+        mask = np.empty(n, dtype=np.bool_)
+        _score_kernel(
+            designers.rate_tier,
+            designers.game_logic_experience,
+            designers.performance_points,
+            avail_le,
+            ambiance_hit,
+            platform_hit,
+            style_hit,
+            float(campaign["budget"]),
+            interactivity,
+            float(threshold),
+            scores,
+            mask,
+        )
+        return scores, mask
+
+    scores = np.where(designers.rate_tier <= campaign["budget"], 20.0, 0.0)
+    scores += 20.0 * ambiance_hit
+    scores += 15.0 * platform_hit
+    scores += 15.0 * (designers.game_logic_experience >= interactivity)
+    scores += 15.0 * style_hit
+    scores += 10.0 * avail_le
+    scores += designers.performance_points
+    return scores, scores >= threshold
+
+
+def warm_up_scoring() -> None:
+    """Compile the Numba kernel and check every scoring path before serving.
+
+    Synthetic snapshots, one per tag index layout and with missing values
+    and unknown tags, are scored by the kernel (when Numba is installed) and
+    by NumPy, and ranked with and without a limit.  Any result that differs
+    from ``calculate_match_score`` stops the worker from starting.
+    """
+    rng = random.Random(0)
+    for tag_count in (8, 128 * MAX_BITMAP_WORDS):
+        tags = [f"tag{i}" for i in range(tag_count)]
+        tag_ids = {tag: i + 1 for i, tag in enumerate(tags)}
+        rows = []
+        for i in range(400):
+            row = {
+                "id": i + 1,
+                "name": f"designer{i}",
+                "rate_tier": rng.choice((None, 1000.0, 5000.0, 9000.0)),
+                "game_logic_experience": rng.choice((None, 1, 3, 5)),
+                "availability": rng.choice((None, "", "2025-08-01", "2025-10-01")),
+                "performance_score": rng.choice((None, 0.0, rng.random())),
+            }
+            for _, column, _ in TAG_CRITERIA:
+                row[column] = rng.sample(tags, rng.randint(0, 3))
+                row[column + "_ids"] = [tag_ids[tag] for tag in row[column]]
+            rows.append(row)
+        designers = DesignerArrays(rows, version=-1, tag_ids=tag_ids)
+        for _ in range(20):
+            campaign = {
+                "budget": rng.choice((0.0, 5000.0, 10000.0)),
+                "interactivity": rng.choice((None, 1, 3)),
+                "timeline": rng.choice((None, "", "2025-09-01")),
+            }
+            for field, _, _ in TAG_CRITERIA:
+                campaign[field] = rng.choice((None, "", "unknown", rng.choice(tags)))
+            expected = [calculate_match_score(campaign, row) for row in rows]
+            for use_kernel in (False, True) if HAVE_NUMBA else (False,):
+                scores, mask = score_designers(campaign, designers, 60.0, use_kernel)
+                if scores.tolist() != expected or mask.tolist() != [s >= 60.0 for s in expected]:
+                    raise RuntimeError(
+                        f"score_designers(use_kernel={use_kernel}) disagrees with the reference"
+                    )
+            order = sorted(range(len(rows)), key=lambda i: -expected[i])
+            for threshold, limit in ((0.0, None), (60.0, None), (60.0, 5)):
+                want = [[rows[i]["id"], expected[i]] for i in order if expected[i] >= threshold][:limit]
+                ranked = orjson.loads(rank_designers(campaign, designers, threshold, limit))
+                if [[m["designer"]["id"], m["score"]] for m in ranked] != want:
+                    raise RuntimeError(f"rank_designers(limit={limit}) disagrees with the reference")
+
+
+def parse_designer(row: sqlite3.Row) -> Dict[str, Any]:
+    """Decode a designer row's list columns.
+
+    The decoded lists are only used for responses; matching reads the tag
+    ids (``<column>_ids``) that ``get_designer_arrays`` loads from the
+    junction tables.
+    """
+    designer = dict(row)
+    for _, column, _ in TAG_CRITERIA:
+        designer[column] = deserialize_list(designer[column])
+        designer[column + "_ids"] = []
+    return designer
+
+
+# Parsed designers keyed by id, the tag dictionary (name -> id), and the
+# snapshot built from them.  Designer rows, their tag links and tag ids never
+# change once written, so a refill only needs the rows added since.
+_designer_cache: Dict[int, Dict[str, Any]] = {}
+_tag_vocab: Dict[str, int] = {}
+_designer_arrays: Optional[DesignerArrays] = None
+_designer_cache_lock = threading.Lock()
+
+
+def get_designer_arrays(conn: sqlite3.Connection) -> DesignerArrays:
+    """Return the designer snapshot, refilling it if the table has changed."""
+    global _designer_arrays
+    version = get_table_version(conn, "designers")
+    arrays = _designer_arrays
+    if arrays is not None and arrays.version == version:
+        return arrays
+    with _designer_cache_lock:
+        arrays = _designer_arrays
+        if arrays is None or arrays.version != version:
+            last_id = max(_designer_cache, default=0)
+            for row in conn.execute("SELECT * FROM designers WHERE id > ? ORDER BY id", (last_id,)):
+                _designer_cache[row["id"]] = parse_designer(row)
+            for _, column, table in TAG_CRITERIA:
+                key = column + "_ids"
+                cur = conn.execute(
+                    f"SELECT designer_id, tag_id FROM {table} WHERE designer_id > ?", (last_id,)
+                )
+                for designer_id, tag_id in cur:
+                    # Links of a designer committed after the rows were read
+                    # are picked up with that designer on the next refill.
+                    if designer_id in _designer_cache:
+                        _designer_cache[designer_id][key].append(tag_id)
+            last_tag_id = max(_tag_vocab.values(), default=0)
+            for tag_id, name in conn.execute("SELECT id, name FROM tags WHERE id > ?", (last_tag_id,)):
+                _tag_vocab[name] = tag_id
+            arrays = DesignerArrays(list(_designer_cache.values()), version, dict(_tag_vocab))
+            _designer_arrays = arrays
+    return arrays
+
+
+# -----------------------------------------------------------------------------
+# List responses
+# -----------------------------------------------------------------------------
+
+# Rows per chunk when streaming a list: large enough to keep the number of
+# threadpool hops low, small enough that memory stays flat with table size.
+STREAM_BATCH_SIZE = 256
+
+
+def list_snapshot(conn: sqlite3.Connection, table: str) -> Tuple[str, int, int]:
+    """Return the deployment token, version and highest row id of ``table``.
+
+    All three are read in one statement.  Rows are only ever appended, so
+    the rows up to that id are exactly the contents of that version.
+    """
+    return conn.execute(
+        f"SELECT (SELECT token FROM deployment), "
+        f"(SELECT version FROM table_versions WHERE name = ?), "
+        f"(SELECT COALESCE(MAX(id), 0) FROM {table})",
+        (table,),
+    ).fetchone()
+
+
+def encode_page(
+    conn: sqlite3.Connection,
+    table: str,
+    shape: Callable[[sqlite3.Row], Any],
+    after_id: int,
+    last_id: int,
+) -> Tuple[int, bytes]:
+    """Encode the next batch of ``table`` rows after ``after_id``.
+
+    Returns the id of the last row encoded and the rows as comma separated
+    JSON, or ``b""`` once no rows up to ``last_id`` remain.
+    """
+    rows = conn.execute(
+        f"SELECT * FROM {table} WHERE id > ? AND id <= ? ORDER BY id LIMIT ?",
+        (after_id, last_id, STREAM_BATCH_SIZE),
+    ).fetchall()
+    if not rows:
+        return after_id, b""
+    return rows[-1]["id"], b",".join(orjson.dumps(shape(row)) for row in rows)
+
+
+async def stream_rows(
+    table: str, shape: Callable[[sqlite3.Row], Any], last_id: int
+) -> AsyncIterator[bytes]:
+    """Yield a JSON array of ``shape(row)`` for the rows of ``table`` up to ``last_id``.
+
+    Each batch is fetched by keyset pagination through ``pool.run``, so no
+    connection is held between chunks and a slow or vanished client never
+    keeps one out of the pool.
+    """
+    opening = b"["
+    after_id = 0
+    while after_id < last_id:
+        after_id, chunk = await pool.run(encode_page, table, shape, after_id, last_id)
+        if not chunk:
+            break
+        yield opening + chunk
+        opening = b","
+    yield b"[]" if opening == b"[" else b"]"
+
+
+def list_response(
+    request: Request,
+    table: str,
+    token: str,
+    version: int,
+    last_id: int,
+    shape: Callable[[sqlite3.Row], Any],
+) -> Response:
+    """Stream ``table``, or answer ``304 Not Modified`` if the client is current.
+
+    The ETag is derived from the deployment token and the table version, so
+    it is known before a single row has been read.
+    """
+    etag = '"%s-%s-%d"' % (token, table, version)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    return StreamingResponse(
+        stream_rows(table, shape, last_id), media_type="application/json", headers={"ETag": etag}
+    )
+
+
 # -----------------------------------------------------------------------------
 # FastAPI application
 # -----------------------------------------------------------------------------
 
-app = FastAPI(title="OrbitiveXR API", version="0.1.0")
+app = FastAPI(title="OrbitiveXR API", version="0.1.0", default_response_class=ORJSONResponse)
 
 
 @app.on_event("startup")
 def startup_event() -> None:
-    # Initialise the database on startup
-    init_db()
+    # Open the connection pool on startup; the schema is bootstrapped by
+    # prestart.py before any worker is spawned.
+    global pool
+    pool = ConnectionPool(DATABASE_NAME)
+    with pool.acquire() as conn:
+        version = get_schema_version(conn)
+    if version != SCHEMA_VERSION:
+        pool.close()
+        raise RuntimeError(
+            f"{DATABASE_NAME} is at schema version {version}, expected {SCHEMA_VERSION}; "
+            "run `python prestart.py` first"
+        )
+    warm_up_scoring()
 
 
-@app.post("/campaigns", response_model=CampaignOut, status_code=201)
-def create_campaign(campaign: CampaignCreate):
-    conn = get_db_connection()
-    cur = conn.cursor()
-    submitted_at = datetime.datetime.utcnow().isoformat()
-    cur.execute(
-        "INSERT INTO campaigns (budget, ambiance, platform_pref, interactivity, style, timeline, submitted_at)"
-        " VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (
-            campaign.budget,
-            campaign.ambiance,
-            campaign.platform_pref,
-            campaign.interactivity,
-            campaign.style,
-            campaign.timeline,
-            submitted_at,
-        ),
+@app.on_event("shutdown")
+def shutdown_event() -> None:
+    if pool is not None:
+        pool.close()
+
+
+INSERT_CAMPAIGN_SQL = (
+    "INSERT INTO campaigns (budget, ambiance, platform_pref, interactivity, style, timeline, submitted_at)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+INSERT_DESIGNER_SQL = (
+    "INSERT INTO designers (name, rate_tier, scene_tags, export_formats, game_logic_experience, visual_metadata, availability, performance_score)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def campaign_params(campaign: CampaignCreate, submitted_at: str) -> Tuple[Any, ...]:
+    return (
+        campaign.budget,
+        campaign.ambiance,
+        campaign.platform_pref,
+        campaign.interactivity,
+        campaign.style,
+        campaign.timeline,
+        submitted_at,
     )
-    conn.commit()
-    campaign_id = cur.lastrowid
-    cur.close()
-    conn.close()
-    return CampaignOut(id=campaign_id, submitted_at=submitted_at, **campaign.dict())
 
 
-@app.get("/campaigns", response_model=List[CampaignOut])
-def list_campaigns():
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM campaigns")
-    campaigns = cur.fetchall()
-    cur.close()
-    conn.close()
+def designer_params(designer: DesignerCreate) -> Tuple[Any, ...]:
+    return (
+        designer.name,
+        designer.rate_tier,
+        serialize_list(designer.scene_tags),
+        serialize_list(designer.export_formats),
+        designer.game_logic_experience,
+        serialize_list(designer.visual_metadata),
+        designer.availability,
+        designer.performance_score,
+    )
+
+
+def insert_rows(conn: sqlite3.Connection, sql: str, params: List[Tuple[Any, ...]]) -> range:
+    """Insert ``params`` and return the new row ids.
+
+    Must run inside ``transaction``: ``BEGIN IMMEDIATE`` holds the write lock
+    for the whole batch, so the AUTOINCREMENT ids it receives are
+    consecutive and end at ``last_insert_rowid()``.
+    """
+    conn.executemany(sql, params)
+    last_id = conn.execute("SELECT last_insert_rowid() AS id").fetchone()["id"]
+    return range(last_id - len(params) + 1, last_id + 1)
+
+
+def insert_campaigns(conn: sqlite3.Connection, params: List[Tuple[Any, ...]]) -> range:
+    with transaction(conn):
+        ids = insert_rows(conn, INSERT_CAMPAIGN_SQL, params)
+        bump_table_version(conn, "campaigns")
+    return ids
+
+
+def insert_designers(conn: sqlite3.Connection, designers: List[DesignerCreate]) -> range:
+    """Insert designers and link them to their tags in one transaction."""
+    params = [designer_params(d) for d in designers]
+    with transaction(conn):
+        ids = insert_rows(conn, INSERT_DESIGNER_SQL, params)
+        for _, column, table in TAG_CRITERIA:
+            links = [(designer_id, tag) for designer_id, d in zip(ids, designers) for tag in getattr(d, column)]
+            conn.executemany("INSERT OR IGNORE INTO tags (name) VALUES (?)", [(tag,) for _, tag in links])
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {table} (designer_id, tag_id) SELECT ?, id FROM tags WHERE name = ?",
+                links,
+            )
+        bump_table_version(conn, "designers")
+    return ids
+
+
+@app.post("/campaigns", response_model=CampaignOut, status_code=201)
+async def create_campaign(campaign: CampaignCreate):
+    submitted_at = utc_timestamp()
+    (campaign_id,) = await pool.run(insert_campaigns, [campaign_params(campaign, submitted_at)])
+    return CampaignOut.model_construct(id=campaign_id, submitted_at=submitted_at, **campaign.model_dump())
+
+
+@app.post("/campaigns/bulk", response_model=List[CampaignOut], status_code=201)
+async def create_campaigns(campaigns: List[CampaignCreate]):
+    if not campaigns:
+        return []
+    submitted_at = utc_timestamp()
+    params = [campaign_params(c, submitted_at) for c in campaigns]
+    ids = await pool.run(insert_campaigns, params)
     return [
-        CampaignOut(
-            id=row["id"],
-            budget=row["budget"],
-            ambiance=row["ambiance"],
-            platform_pref=row["platform_pref"],
-            interactivity=row["interactivity"],
-            style=row["style"],
-            timeline=row["timeline"],
-            submitted_at=row["submitted_at"],
-        )
-        for row in campaigns
+        CampaignOut.model_construct(id=campaign_id, submitted_at=submitted_at, **campaign.model_dump())
+        for campaign_id, campaign in zip(ids, campaigns)
     ]
 
 
+@app.get("/campaigns", response_model=List[CampaignOut])
+async def list_campaigns(request: Request):
+    token, version, last_id = await pool.run(list_snapshot, "campaigns")
+    return list_response(request, "campaigns", token, version, last_id, campaign_out)
+
+
 @app.post("/designers", response_model=DesignerOut, status_code=201)
-def create_designer(designer: DesignerCreate):
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO designers (name, rate_tier, scene_tags, export_formats, game_logic_experience, visual_metadata, availability, performance_score)"
-        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-        (
-            designer.name,
-            designer.rate_tier,
-            serialize_list(designer.scene_tags),
-            serialize_list(designer.export_formats),
-            designer.game_logic_experience,
-            serialize_list(designer.visual_metadata),
-            designer.availability,
-            designer.performance_score,
-        ),
-    )
-    conn.commit()
-    designer_id = cur.lastrowid
-    cur.close()
-    conn.close()
-    return DesignerOut(id=designer_id, **designer.dict())
+async def create_designer(designer: DesignerCreate):
+    (designer_id,) = await pool.run(insert_designers, [designer])
+    return DesignerOut.model_construct(id=designer_id, **designer.model_dump())
+
+
+@app.post("/designers/bulk", response_model=List[DesignerOut], status_code=201)
+async def create_designers(designers: List[DesignerCreate]):
+    if not designers:
+        return []
+    ids = await pool.run(insert_designers, designers)
+    return [
+        DesignerOut.model_construct(id=designer_id, **designer.model_dump())
+        for designer_id, designer in zip(ids, designers)
+    ]
+
+
+def designer_row_out(row: sqlite3.Row) -> Dict[str, Any]:
+    return designer_out(parse_designer(row))
 
 
 @app.get("/designers", response_model=List[DesignerOut])
-def list_designers():
-    conn = get_db_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM designers")
-    designers = cur.fetchall()
-    cur.close()
-    conn.close()
-    result: List[DesignerOut] = []
-    for d in designers:
-        result.append(
-            DesignerOut(
-                id=d["id"],
-                name=d["name"],
-                rate_tier=d["rate_tier"],
-                scene_tags=deserialize_list(d.get("scene_tags")),
-                export_formats=deserialize_list(d.get("export_formats")),
-                game_logic_experience=d["game_logic_experience"],
-                visual_metadata=deserialize_list(d.get("visual_metadata")),
-                availability=d["availability"],
-                performance_score=d.get("performance_score") or 0.0,
-            )
-        )
-    return result
+async def list_designers(request: Request):
+    token, version, last_id = await pool.run(list_snapshot, "designers")
+    return list_response(request, "designers", token, version, last_id, designer_row_out)
 
 
-@app.post("/match", response_model=List[ScoredDesigner])
-def match_designers(match_request: MatchRequest):
-    conn = get_db_connection()
-    cur = conn.cursor()
-    # Fetch the campaign
-    cur.execute("SELECT * FROM campaigns WHERE id = ?", (match_request.campaign_id,))
-    campaign = cur.fetchone()
+def load_match_inputs(
+    conn: sqlite3.Connection, campaign_id: int
+) -> Optional[Tuple[sqlite3.Row, DesignerArrays]]:
+    campaign = conn.execute("SELECT * FROM campaigns WHERE id = ?", (campaign_id,)).fetchone()
     if not campaign:
-        cur.close()
-        conn.close()
+        return None
+    return campaign, get_designer_arrays(conn)
+
+
+def rank_designers(
+    campaign: sqlite3.Row, designers: DesignerArrays, threshold: float, limit: Optional[int]
+) -> bytes:
+    scores, mask = score_designers(campaign, designers, threshold)
+    matched = np.flatnonzero(mask)
+    if limit is not None and limit < matched.size:
+        # Keep the top ``limit`` without sorting every match: partition to
+        # find the cut‑off score, then break ties at the cut‑off by table
+        # order, exactly as the full stable sort below would.
+        top = scores[matched]
+        cutoff = -np.partition(-top, limit - 1)[limit - 1]
+        above = matched[top > cutoff]
+        matched = np.concatenate((above, matched[top == cutoff][: limit - above.size]))
+    # Sort descending; a stable sort keeps equal scores in table order
+    matched = matched[np.argsort(-scores[matched], kind="stable")]
+
+    rows = designers.rows
+    return orjson.dumps(
+        [{"designer": designer_out(rows[i]), "score": float(scores[i])} for i in matched]
+    )
+
+
+# Memoised /match bodies per snapshot, least recently used evicted first.  Bodies larger
+# than MATCH_CACHE_MAX_BODY (e.g. a low threshold over a big table) are not
+# kept, which bounds the memo to MATCH_CACHE_SIZE * MATCH_CACHE_MAX_BODY bytes.
+MATCH_CACHE_SIZE = 1024
+MATCH_CACHE_MAX_BODY = 64 * 1024
+
+
+def ranked_response(
+    designers: DesignerArrays, campaign: sqlite3.Row, threshold: float, limit: Optional[int]
+) -> bytes:
+    """Return the ``/match`` body for ``campaign``, memoised on the snapshot."""
+    key = (campaign["id"], threshold, limit)
+    responses = designers.responses
+    with designers.responses_lock:
+        body = responses.get(key)
+        if body is not None:
+            responses.move_to_end(key)
+            return body
+    body = rank_designers(campaign, designers, threshold, limit)
+    if len(body) <= MATCH_CACHE_MAX_BODY:
+        with designers.responses_lock:
+            responses[key] = body
+            responses.move_to_end(key)
+            if len(responses) > MATCH_CACHE_SIZE:
+                responses.popitem(last=False)
+    return body
+
+
+@app.post("/match", response_model=List[ScoredDesigner])
+async def match_designers(match_request: MatchRequest):
+    inputs = await pool.run(load_match_inputs, match_request.campaign_id)
+    if inputs is None:
         raise HTTPException(status_code=404, detail=f"Campaign {match_request.campaign_id} not found")
-    # Fetch all designers
-    cur.execute("SELECT * FROM designers")
-    designers = cur.fetchall()
-    cur.close()
-    conn.close()
-
-    scored_designers: List[ScoredDesigner] = []
-    for d in designers:
-        d["scene_tags"] = deserialize_list(d.get("scene_tags"))
-        d["export_formats"] = deserialize_list(d.get("export_formats"))
-        d["visual_metadata"] = deserialize_list(d.get("visual_metadata"))
-        score = calculate_match_score(campaign, d)
-        if score >= match_request.threshold:
-            scored_designers.append(
-                ScoredDesigner(
-                    designer=DesignerOut(
-                        id=d["id"],
-                        name=d["name"],
-                        rate_tier=d["rate_tier"],
-                        scene_tags=d["scene_tags"],
-                        export_formats=d["export_formats"],
-                        game_logic_experience=d["game_logic_experience"],
-                        visual_metadata=d["visual_metadata"],
-                        availability=d["availability"],
-                        performance_score=d.get("performance_score") or 0.0,
-                    ),
-                    score=score,
-                )
-            )
-    # Sort descending
-    scored_designers.sort(key=lambda sd: sd.score, reverse=True)
-    return scored_designers
+    campaign, designers = inputs
+    # Scoring is CPU work; keep it off the event loop too
+    body = await asyncio.to_thread(
+        ranked_response, designers, campaign, match_request.threshold, match_request.limit
+    )
+    return Response(content=body, media_type="application/json")
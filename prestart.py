@@ -0,0 +1,11 @@
+"""
+Pre-start step for the OrbitiveXR API.
+
+Creates or migrates the SQLite schema once, before uvicorn spawns any
+workers, so the workers never race each other on DDL.
+"""
+
+from main import DATABASE_NAME, bootstrap_schema
+
+if __name__ == "__main__":
+    bootstrap_schema(DATABASE_NAME)